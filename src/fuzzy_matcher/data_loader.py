@@ -1,43 +1,107 @@
 """
 Data loader module for reading Excel files.
 """
+import openpyxl
 import pandas as pd
 import logging
 from pathlib import Path
 
+# python-calamine (Rust-backed parser) is preferred for reads when available;
+# openpyxl read_only mode is the fallback
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
 logger = logging.getLogger(__name__)
 
 
 class ExcelDataLoader:
     """Handles loading data from Excel files."""
-    
+
+    @staticmethod
+    def _read_columns(filepath: str, columns: list) -> pd.DataFrame:
+        """
+        Stream an Excel worksheet and collect only the requested columns.
+
+        Uses the calamine parser when installed, falling back to openpyxl in
+        read_only mode; either way rows are parsed incrementally instead of
+        building the full workbook DOM in memory.
+
+        Args:
+            filepath: Path to the Excel file, or an open binary buffer
+            columns: Column names to collect, resolved against the header row
+
+        Returns:
+            DataFrame containing the requested columns that exist in the file
+        """
+        if CalamineWorkbook is not None:
+            if isinstance(filepath, (str, Path)):
+                workbook = CalamineWorkbook.from_path(str(filepath))
+            else:
+                workbook = CalamineWorkbook.from_filelike(filepath)
+            rows = iter(workbook.get_sheet_by_index(0).to_python())
+            return ExcelDataLoader._collect_columns(rows, columns)
+
+        workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            return ExcelDataLoader._collect_columns(rows, columns)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _collect_columns(rows, columns: list) -> pd.DataFrame:
+        """
+        Build a DataFrame from a row iterator, keeping only requested columns.
+
+        Args:
+            rows: Iterator of row tuples/lists, the first being the header
+            columns: Column names to collect, resolved against the header row
+
+        Returns:
+            DataFrame containing the requested columns that exist in the data
+        """
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame(columns=columns)
+
+        # Resolve requested columns to positions in the header row
+        positions = {name: i for i, name in enumerate(header)}
+        present = [col for col in columns if col in positions]
+        indices = [positions[col] for col in present]
+
+        records = [
+            tuple(row[i] if i < len(row) else None for i in indices)
+            for row in rows
+        ]
+        return pd.DataFrame.from_records(records, columns=present)
+
     @staticmethod
     def load_source_data(filepath: str, desc_col: str, amount_col: str) -> pd.DataFrame:
         """
         Load source data with descriptions and amounts.
-        
+
         Args:
-            filepath: Path to the Excel file
+            filepath: Path to the Excel file, or an open binary buffer
             desc_col: Name of the description column
             amount_col: Name of the amount column
-            
+
         Returns:
             DataFrame with Description and Amount columns
         """
         try:
-            path = Path(filepath)
-            if not path.exists():
+            if isinstance(filepath, (str, Path)) and not Path(filepath).exists():
                 raise FileNotFoundError(f"Source file not found: {filepath}")
             
-            df = pd.read_excel(filepath)
+            df = ExcelDataLoader._read_columns(filepath, [desc_col, amount_col])
             logger.info(f"Loaded {len(df)} rows from source file: {filepath}")
-            
+
             # Validate required columns
             if desc_col not in df.columns or amount_col not in df.columns:
                 raise ValueError(f"Required columns {desc_col} and/or {amount_col} not found in {filepath}")
-            
-            # Select and rename columns
-            df = df[[desc_col, amount_col]].copy()
+
+            # Rename columns (only the required ones were read)
             df.columns = ['Description', 'Amount']
             
             # Clean data
@@ -58,29 +122,27 @@ class ExcelDataLoader:
     def load_reference_data(filepath: str, desc_col: str, code_col: str) -> pd.DataFrame:
         """
         Load reference data with descriptions and codes.
-        
+
         Args:
-            filepath: Path to the Excel file
+            filepath: Path to the Excel file, or an open binary buffer
             desc_col: Name of the description column
             code_col: Name of the code column
-            
+
         Returns:
             DataFrame with Description and Code columns
         """
         try:
-            path = Path(filepath)
-            if not path.exists():
+            if isinstance(filepath, (str, Path)) and not Path(filepath).exists():
                 raise FileNotFoundError(f"Reference file not found: {filepath}")
             
-            df = pd.read_excel(filepath)
+            df = ExcelDataLoader._read_columns(filepath, [desc_col, code_col])
             logger.info(f"Loaded {len(df)} rows from reference file: {filepath}")
-            
+
             # Validate required columns
             if desc_col not in df.columns or code_col not in df.columns:
                 raise ValueError(f"Required columns {desc_col} and/or {code_col} not found in {filepath}")
-            
-            # Select and rename columns
-            df = df[[desc_col, code_col]].copy()
+
+            # Rename columns (only the required ones were read)
             df.columns = ['Description', 'Code']
             
             # Clean data
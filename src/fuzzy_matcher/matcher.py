@@ -1,6 +1,7 @@
 """
 Fuzzy matching engine for finding best matches between source and reference data.
 """
+import numpy as np
 import pandas as pd
 import logging
 from typing import Dict, List
@@ -11,20 +12,27 @@ logger = logging.getLogger(__name__)
 
 class FuzzyMatcher:
     """Performs fuzzy matching between source and reference datasets."""
-    
-    def __init__(self, threshold: float = 70.0, amount_tolerance: float = 5.0, 
-                 exact_match_bonus: float = 20.0):
+
+    # Below this many reference rows a full scan is cheaper than building
+    # and probing the blocking index
+    BLOCKING_MIN_REFERENCES = 500
+
+    def __init__(self, threshold: float = 70.0, amount_tolerance: float = 5.0,
+                 exact_match_bonus: float = 20.0, workers: int = -1):
         """
         Initialize the fuzzy matcher.
-        
+
         Args:
             threshold: Minimum score threshold for accepting a match
             amount_tolerance: Percentage tolerance for numeric matching
             exact_match_bonus: Bonus points for exact numeric match
+            workers: Thread count for batch text scoring (-1 uses all cores)
         """
         self.threshold = threshold
+        self.workers = workers
         self.scorer = NumericAwareScorer(amount_tolerance, exact_match_bonus)
-        self.audit_records = []
+        self._audit_df = pd.DataFrame()
+        self._ref_cache = None
     
     def find_best_match(self, source_desc: str, source_amount: float, 
                        reference_df: pd.DataFrame) -> Dict:
@@ -39,30 +47,314 @@ class FuzzyMatcher:
         Returns:
             Dictionary with match results and details
         """
-        best_score = 0
-        best_match = None
-        best_details = None
+        ref_descs = reference_df['Description'].tolist()
+        ref_codes = reference_df['Code'].tolist()
+
+        if not ref_descs:
+            return self._build_match_result(0, None, None)
+
+        # Delegate to the batch machinery with a single-row query so the
+        # scoring stays in native code even for the scalar API
+        src_processed = [NumericAwareScorer.preprocess_for_token_sort(source_desc)]
+        ref_processed, ref_numbers = self._prepare_reference(ref_descs)
+        amounts = np.asarray([source_amount], dtype=np.float64)
+
+        best_indices, best_text_scores = self._select_best_dense(
+            src_processed, ref_processed, amounts, ref_numbers
+        )
+
+        j = best_indices[0]
+        score, details = self._score_candidate(
+            float(best_text_scores[0]), source_amount, ref_descs[j]
+        )
+        best_match = {'Description': ref_descs[j], 'Code': ref_codes[j]}
+
+        # Return result only if above threshold
+        return self._build_match_result(score, best_match, details)
+    
+    def match_datasets(self, source_df: pd.DataFrame, 
+                      reference_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Match all entries from source dataset to reference dataset.
         
-        # Iterate through all reference entries
-        for idx, row in reference_df.iterrows():
-            ref_desc = row['Description']
-            ref_code = row['Code']
+        Args:
+            source_df: DataFrame with source descriptions and amounts
+            reference_df: DataFrame with reference descriptions and codes
             
-            # Calculate score with details
-            score, details = self.scorer.calculate_final_score(
-                source_desc, source_amount, ref_desc
+        Returns:
+            DataFrame with matched results
+        """
+        logger.info(f"Starting fuzzy matching for {len(source_df)} source entries "
+                   f"against {len(reference_df)} reference entries")
+
+        source_descs = source_df['Description'].tolist()
+        source_amounts = source_df['Amount'].tolist()
+        ref_descs = reference_df['Description'].tolist()
+        ref_codes = reference_df['Code'].tolist()
+
+        # Compute the full text-score matrix in one native call instead of
+        # scoring each pair in a Python-level double loop
+        if source_descs and ref_descs:
+            # Tokenize and sort each string once up front; token_sort_ratio
+            # would otherwise redo this for both sides of every pair
+            src_processed = [NumericAwareScorer.preprocess_for_token_sort(s)
+                             for s in source_descs]
+            ref_processed, ref_numbers = self._prepare_reference(ref_descs)
+            amounts = np.asarray(source_amounts, dtype=np.float64)
+
+            if len(ref_descs) >= self.BLOCKING_MIN_REFERENCES:
+                best_indices, best_text_scores = self._select_best_blocked(
+                    src_processed, ref_processed, amounts, ref_numbers
+                )
+            else:
+                best_indices, best_text_scores = self._select_best_dense(
+                    src_processed, ref_processed, amounts, ref_numbers
+                )
+        else:
+            best_indices = None
+
+        # Accumulate one list per output column (struct-of-arrays) instead of
+        # a dict per row; the DataFrames are then built in a single step
+        # without per-row type inference
+        matched_codes = []
+        match_scores = []
+        match_types = []
+        matched_descriptions = []
+        text_score_col = []
+        numeric_match_col = []
+        final_score_col = []
+        explanations = []
+
+        for i, source_amount in enumerate(source_amounts):
+            if best_indices is None or best_indices[i] < 0:
+                match_result = self._build_match_result(0, None, None)
+            else:
+                j = best_indices[i]
+                score, details = self._score_candidate(
+                    float(best_text_scores[i]), source_amount, ref_descs[j]
+                )
+                best_match = {'Description': ref_descs[j], 'Code': ref_codes[j]}
+                match_result = self._build_match_result(score, best_match, details)
+
+            details = match_result['details']
+            matched_codes.append(match_result['code'])
+            match_scores.append(round(match_result['score'], 2))
+            match_types.append(details['match_type'])
+            matched_descriptions.append(match_result['matched_description'])
+            text_score_col.append(round(details['text_score'], 2))
+            numeric_match_col.append(details['numeric_consistent'])
+            final_score_col.append(round(details['final_score'], 2))
+            explanations.append(details['explanation'])
+
+            if (i + 1) % 10 == 0:
+                logger.info(f"Processed {i + 1}/{len(source_df)} entries")
+
+        self._audit_df = pd.DataFrame({
+            'Source_Description': source_descs,
+            'Source_Amount': source_amounts,
+            'Matched_Description': matched_descriptions,
+            'Matched_Code': matched_codes,
+            'Text_Match_Score': text_score_col,
+            'Numeric_Match': numeric_match_col,
+            'Final_Score': final_score_col,
+            'Match_Type': match_types,
+            'Explanation': explanations
+        })
+
+        logger.info(f"Matching complete. {len(source_descs)} entries processed.")
+
+        return pd.DataFrame({
+            'Description': source_descs,
+            'Amount': source_amounts,
+            'Matched_Code': matched_codes,
+            'Match_Score': match_scores,
+            'Match_Type': match_types
+        })
+
+    def _prepare_reference(self, ref_descs: List[str]) -> tuple:
+        """
+        Preprocess the reference side once and cache it on the instance.
+
+        The reference set is immutable during a matching run, so repeated
+        calls against the same descriptions (e.g. find_best_match in a loop,
+        or successive match_datasets runs) reuse the token-sorted strings
+        and the parsed number table instead of rebuilding them.
+
+        Args:
+            ref_descs: Reference description strings
+
+        Returns:
+            Tuple of (ref_processed, ref_numbers)
+        """
+        if self._ref_cache is None or self._ref_cache[0] != ref_descs:
+            ref_processed = [NumericAwareScorer.preprocess_for_token_sort(s)
+                             for s in ref_descs]
+            ref_numbers = NumericAwareScorer.precompute_reference_numbers(ref_descs)
+            self._ref_cache = (list(ref_descs), ref_processed, ref_numbers)
+
+        return self._ref_cache[1], self._ref_cache[2]
+
+    def _select_best_dense(self, src_processed: List[str], ref_processed: List[str],
+                           amounts: np.ndarray, ref_numbers: np.ndarray) -> tuple:
+        """
+        Pick the best reference per source row by scoring every pair.
+
+        Args:
+            src_processed: Token-sorted source descriptions
+            ref_processed: Token-sorted reference descriptions
+            amounts: Source amounts as a float array
+            ref_numbers: Precomputed reference-number table
+
+        Returns:
+            Tuple of (best_indices, best_text_scores) arrays, one entry
+            per source row
+        """
+        # Pairs whose text score cannot reach the threshold even with a
+        # full numeric bonus are pruned inside the native scorer
+        cutoff = max(0, self.threshold - self.scorer.exact_match_bonus)
+
+        final_scores, text_scores = self.scorer.calculate_final_scores_batch(
+            src_processed, ref_processed, amounts, ref_numbers,
+            workers=self.workers, score_cutoff=cutoff
+        )
+        best_indices = final_scores.argmax(axis=1)
+        best_text_scores = text_scores[np.arange(len(src_processed)), best_indices]
+
+        return best_indices, best_text_scores
+
+    def _select_best_blocked(self, src_processed: List[str], ref_processed: List[str],
+                             amounts: np.ndarray, ref_numbers: np.ndarray) -> tuple:
+        """
+        Pick the best reference per source row using token blocking.
+
+        An inverted token index prunes the candidate set to references
+        sharing at least one token with the source, so only ~N*k pairs are
+        scored instead of N*M. Used for large reference sets, where most
+        pairs share no vocabulary at all.
+
+        Args:
+            src_processed: Token-sorted source descriptions
+            ref_processed: Token-sorted reference descriptions
+            amounts: Source amounts as a float array
+            ref_numbers: Precomputed reference-number table
+
+        Returns:
+            Tuple of (best_indices, best_text_scores) arrays; index -1 marks
+            rows with no candidate sharing a token
+        """
+        # Inverted index: token -> reference rows containing it, plus a hash
+        # lookup for textually identical references (first occurrence wins)
+        block_index = {}
+        exact_lookup = {}
+        for j, processed in enumerate(ref_processed):
+            exact_lookup.setdefault(processed, j)
+            for token in processed.split():
+                block_index.setdefault(token, []).append(j)
+
+        cutoff = max(0, self.threshold - self.scorer.exact_match_bonus)
+        n = len(src_processed)
+        best_indices = np.full(n, -1)
+        best_text_scores = np.zeros(n)
+
+        # String lengths bound fuzz.ratio from above, so candidates whose
+        # length alone caps them below the cutoff are dropped before the
+        # edit-distance pass
+        ref_lengths = np.fromiter(
+            (len(s) for s in ref_processed), dtype=np.int64, count=len(ref_processed)
+        )
+
+        for i, processed in enumerate(src_processed):
+            # An exact text match with consistent numbers scores a clipped
+            # 100 and cannot be beaten, so the fuzzy sweep can be skipped
+            j = exact_lookup.get(processed)
+            if j is not None:
+                consistent, _ = self.scorer.score_numeric_batch(
+                    amounts[i:i + 1], ref_numbers[j:j + 1]
+                )
+                if consistent[0, 0]:
+                    best_indices[i] = j
+                    best_text_scores[i] = 100.0
+                    continue
+
+            candidates = set()
+            for token in processed.split():
+                candidates.update(block_index.get(token, ()))
+            if not candidates:
+                continue
+
+            candidates = np.fromiter(candidates, dtype=np.int64)
+
+            # fuzz.ratio can reach at most 200*min(la,lb)/(la+lb), so any
+            # candidate below the cutoff on lengths alone cannot clear the
+            # threshold even with the full numeric bonus
+            if cutoff > 0:
+                lengths = ref_lengths[candidates]
+                upper_bound = 200.0 * np.minimum(len(processed), lengths) \
+                    / (len(processed) + lengths)
+                candidates = candidates[upper_bound >= cutoff]
+                if not candidates.size:
+                    continue
+
+            final_row, text_row = self.scorer.calculate_final_scores_batch(
+                [processed], [ref_processed[j] for j in candidates],
+                amounts[i:i + 1], ref_numbers[candidates],
+                score_cutoff=cutoff
             )
-            
-            # Track best match
-            if score > best_score:
-                best_score = score
-                best_match = {
-                    'Description': ref_desc,
-                    'Code': ref_code
-                }
-                best_details = details
-        
-        # Return result only if above threshold
+
+            best = final_row[0].argmax()
+            best_indices[i] = candidates[best]
+            best_text_scores[i] = text_row[0][best]
+
+        return best_indices, best_text_scores
+
+    def _score_candidate(self, text_score: float, source_amount: float,
+                         ref_desc: str) -> tuple:
+        """
+        Combine a precomputed text score with numeric consistency for one pair.
+
+        Args:
+            text_score: Precomputed text similarity score (0-100)
+            source_amount: Amount from the source entry
+            ref_desc: Reference description
+
+        Returns:
+            Tuple of (final_score, details_dict)
+        """
+        is_consistent, numeric_score, explanation = self.scorer.check_numeric_consistency(
+            source_amount, ref_desc
+        )
+
+        if not is_consistent:
+            final_score = max(0, text_score + numeric_score)
+        else:
+            final_score = min(100, text_score + numeric_score)
+
+        match_type = self.scorer.classify_match_type(final_score)
+
+        details = {
+            'text_score': text_score,
+            'numeric_consistent': is_consistent,
+            'numeric_score': numeric_score,
+            'final_score': final_score,
+            'match_type': match_type,
+            'explanation': explanation
+        }
+
+        return final_score, details
+
+    def _build_match_result(self, best_score: float, best_match: Dict,
+                            best_details: Dict) -> Dict:
+        """
+        Assemble the match-result dictionary from the best candidate found.
+
+        Args:
+            best_score: Score of the best candidate
+            best_match: Best candidate's Description/Code, or None
+            best_details: Scoring details of the best candidate, or None
+
+        Returns:
+            Dictionary with match results and details
+        """
         if best_score >= self.threshold and best_match:
             return {
                 'matched': True,
@@ -87,62 +379,6 @@ class FuzzyMatcher:
                 }
             }
     
-    def match_datasets(self, source_df: pd.DataFrame, 
-                      reference_df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Match all entries from source dataset to reference dataset.
-        
-        Args:
-            source_df: DataFrame with source descriptions and amounts
-            reference_df: DataFrame with reference descriptions and codes
-            
-        Returns:
-            DataFrame with matched results
-        """
-        logger.info(f"Starting fuzzy matching for {len(source_df)} source entries "
-                   f"against {len(reference_df)} reference entries")
-        
-        results = []
-        self.audit_records = []
-        
-        for idx, source_row in source_df.iterrows():
-            source_desc = source_row['Description']
-            source_amount = source_row['Amount']
-            
-            # Find best match
-            match_result = self.find_best_match(source_desc, source_amount, reference_df)
-            
-            # Prepare result record
-            result = {
-                'Description': source_desc,
-                'Amount': source_amount,
-                'Matched_Code': match_result['code'],
-                'Match_Score': round(match_result['score'], 2),
-                'Match_Type': match_result['details']['match_type']
-            }
-            results.append(result)
-            
-            # Prepare audit record
-            audit_record = {
-                'Source_Description': source_desc,
-                'Source_Amount': source_amount,
-                'Matched_Description': match_result['matched_description'],
-                'Matched_Code': match_result['code'],
-                'Text_Match_Score': round(match_result['details']['text_score'], 2),
-                'Numeric_Match': match_result['details']['numeric_consistent'],
-                'Final_Score': round(match_result['details']['final_score'], 2),
-                'Match_Type': match_result['details']['match_type'],
-                'Explanation': match_result['details']['explanation']
-            }
-            self.audit_records.append(audit_record)
-            
-            if (idx + 1) % 10 == 0:
-                logger.info(f"Processed {idx + 1}/{len(source_df)} entries")
-        
-        logger.info(f"Matching complete. {len(results)} entries processed.")
-        
-        return pd.DataFrame(results)
-    
     def get_audit_log(self) -> pd.DataFrame:
         """
         Get the audit log with detailed matching information.
@@ -150,4 +386,4 @@ class FuzzyMatcher:
         Returns:
             DataFrame with audit records
         """
-        return pd.DataFrame(self.audit_records)
+        return self._audit_df
@@ -1,13 +1,57 @@
 """
 Output writer module for saving results to Excel files.
 """
+import hashlib
+import math
+import re
+import zipfile
+import numpy as np
+import openpyxl
 import pandas as pd
 import logging
 from pathlib import Path
 from datetime import datetime
+from xml.sax.saxutils import escape
+
+# xlsxwriter is the fastest engine for plain tabular writes; openpyxl
+# write_only streaming remains the fallback when it is not installed
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
 
 logger = logging.getLogger(__name__)
 
+# Static parts of a minimal xlsx package; only the worksheet XML varies
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+    ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{sheet_name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
 
 class ExcelOutputWriter:
     """Handles writing results to Excel files."""
@@ -24,81 +68,290 @@ class ExcelOutputWriter:
         output_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Output directory ensured: {output_dir}")
     
+    @staticmethod
+    def _write_workbook(sheets, filepath: str) -> None:
+        """
+        Write one or more DataFrames as sheets of a single workbook.
+
+        Args:
+            sheets: Iterable of (sheet_name, DataFrame) pairs
+            filepath: Path to save the Excel file
+        """
+        if xlsxwriter is not None:
+            # Columns are dtype-homogeneous, so write one column at a
+            # time; write_column resolves the value type once per column
+            # instead of once per cell
+            workbook = xlsxwriter.Workbook(filepath)
+            try:
+                for sheet_name, df in sheets:
+                    worksheet = workbook.add_worksheet(sheet_name)
+                    worksheet.write_row(0, 0, df.columns)
+                    for j, column in enumerate(df.columns):
+                        values = df[column].to_numpy()
+                        if values.dtype.kind == 'f':
+                            # One vectorized finite sweep per column;
+                            # xlsxwriter would otherwise reject NaN/Inf
+                            # cell by cell
+                            bad = ~np.isfinite(values)
+                            if bad.any():
+                                values = values.astype(object)
+                                values[bad] = None
+                        worksheet.write_column(1, j, values.tolist())
+            finally:
+                workbook.close()
+        else:
+            # Stream rows in write_only mode; to_excel via openpyxl would
+            # buffer the full workbook and wrap every value in a cell
+            # object first
+            workbook = openpyxl.Workbook(write_only=True)
+            for sheet_name, df in sheets:
+                worksheet = workbook.create_sheet(sheet_name)
+                worksheet.append(list(df.columns))
+                for row in df.itertuples(index=False, name=None):
+                    worksheet.append(row)
+            workbook.save(filepath)
+
     @staticmethod
     def save_results(df: pd.DataFrame, filepath: str) -> None:
         """
         Save matched results to Excel file.
-        
+
         Args:
             df: DataFrame with matched results
             filepath: Path to save the Excel file
         """
         try:
             ExcelOutputWriter.ensure_output_directory(filepath)
-            
-            # Save to Excel
-            df.to_excel(filepath, index=False, engine='openpyxl')
+            ExcelOutputWriter._write_workbook([('Results', df)], filepath)
             logger.info(f"Results saved to: {filepath}")
-            
+
         except Exception as e:
             logger.error(f"Error saving results to {filepath}: {str(e)}")
             raise
+
+    @staticmethod
+    def save_all(results_df: pd.DataFrame, audit_df: pd.DataFrame,
+                 results_path: str, audit_path: str = None) -> None:
+        """
+        Save results and the audit log, sharing one workbook when possible.
+
+        With no separate audit path, both sheets go into a single workbook
+        at results_path, paying the zip-container overhead once.
+
+        Args:
+            results_df: DataFrame with matched results
+            audit_df: DataFrame with audit records
+            results_path: Path for the results workbook
+            audit_path: Optional separate path for the audit workbook; when
+                given, the two files are written exactly as save_results and
+                save_audit_log would
+        """
+        if audit_path is not None:
+            ExcelOutputWriter.save_results(results_df, results_path)
+            ExcelOutputWriter.save_audit_log(audit_df, audit_path)
+            return
+
+        try:
+            ExcelOutputWriter.ensure_output_directory(results_path)
+            ExcelOutputWriter._write_workbook(
+                [('Results', results_df), ('Audit Log', audit_df)], results_path
+            )
+            logger.info(f"Results and audit log saved to: {results_path}")
+
+        except Exception as e:
+            logger.error(f"Error saving results to {results_path}: {str(e)}")
+            raise
     
+    @staticmethod
+    def _cell_xml(value) -> str:
+        """
+        Serialize one cell value as OOXML.
+
+        Args:
+            value: Python or numpy scalar from an itertuples row
+
+        Returns:
+            An OOXML ``<c>`` element string
+        """
+        if value is None:
+            return '<c/>'
+        if isinstance(value, (bool, np.bool_)):
+            return '<c t="b"><v>%d</v></c>' % value
+        if isinstance(value, (int, float, np.integer, np.floating)):
+            if not math.isfinite(value):  # NaN/Inf have no OOXML representation
+                return '<c/>'
+            return '<c><v>%r</v></c>' % float(value)
+        return '<c t="inlineStr"><is><t>%s</t></is></c>' % escape(str(value))
+
+    @staticmethod
+    def _column_serializers(df: pd.DataFrame) -> list:
+        """
+        Choose one cell serializer per column from its dtype.
+
+        Columns are dtype-homogeneous, so the type dispatch in _cell_xml can
+        be resolved once per column instead of once per cell.
+
+        Args:
+            df: DataFrame about to be streamed
+
+        Returns:
+            List of callables, one per column, mapping a value to OOXML
+        """
+        serializers = []
+        for dtype in df.dtypes:
+            # pandas predicates also cover extension dtypes, which
+            # np.issubdtype cannot interpret
+            if pd.api.types.is_bool_dtype(dtype):
+                serializers.append(lambda v: '<c t="b"><v>%d</v></c>' % v)
+            elif pd.api.types.is_numeric_dtype(dtype):
+                serializers.append(
+                    lambda v: '<c><v>%r</v></c>' % float(v)
+                    if math.isfinite(v) else '<c/>'
+                )
+            else:
+                # Object columns can hold anything; keep the per-value dispatch
+                serializers.append(ExcelOutputWriter._cell_xml)
+        return serializers
+
+    @staticmethod
+    def _write_xlsx_stream(columns, row_iter, filepath: str, sheet_name: str,
+                           widths=None, serializers=None) -> None:
+        """
+        Write rows as a minimal xlsx package, streaming the sheet XML.
+
+        Bypasses library-level cell objects entirely: each row is formatted
+        as OOXML text and written straight into the zip archive, so no
+        workbook model is ever built in memory.
+
+        Args:
+            columns: Header row (column names)
+            row_iter: Iterable of row tuples
+            filepath: Path to save the Excel file
+            sheet_name: Name of the single worksheet
+            widths: Optional per-column widths in character units
+            serializers: Optional per-column cell serializers; cells fall
+                back to the generic per-value dispatch when omitted
+        """
+        cell_xml = ExcelOutputWriter._cell_xml
+        if serializers is None:
+            serializers = [cell_xml] * len(columns)
+        with zipfile.ZipFile(filepath, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES)
+            archive.writestr('_rels/.rels', _XLSX_ROOT_RELS)
+            archive.writestr('xl/workbook.xml',
+                             _XLSX_WORKBOOK.format(sheet_name=escape(sheet_name)))
+            archive.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS)
+
+            with archive.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+                parts = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">']
+                if widths:
+                    parts.append('<cols>')
+                    parts.extend(
+                        '<col min="%d" max="%d" width="%d" customWidth="1"/>' % (i, i, width)
+                        for i, width in enumerate(widths, start=1)
+                    )
+                    parts.append('</cols>')
+                parts.append('<sheetData>')
+                parts.append('<row>%s</row>' % ''.join(cell_xml(c) for c in columns))
+                sheet.write(''.join(parts).encode('utf-8'))
+
+                for row in row_iter:
+                    row_xml = '<row>%s</row>' % ''.join(
+                        serialize(v) for serialize, v in zip(serializers, row)
+                    )
+                    sheet.write(row_xml.encode('utf-8'))
+
+                sheet.write(b'</sheetData></worksheet>')
+
     @staticmethod
     def save_audit_log(df: pd.DataFrame, filepath: str) -> None:
         """
         Save audit log with detailed matching information to Excel file.
-        
+
         Args:
             df: DataFrame with audit records
             filepath: Path to save the Excel file
         """
         try:
             ExcelOutputWriter.ensure_output_directory(filepath)
-            
-            # Create Excel writer with formatting
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Audit Log', index=False)
-                
-                # Get the worksheet
-                worksheet = writer.sheets['Audit Log']
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except (AttributeError, TypeError):
-                            # Skip cells with None or non-string values
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)  # Cap at 50
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-            
+
+            # One vectorized length pass per column replaces the old
+            # per-cell width scan; fillna keeps missing cells (which
+            # astype(str) propagates) from poisoning the max
+            widths = [
+                min(max(len(str(column)),
+                        int(df[column].astype(str).str.len().fillna(0).max()) if len(df) else 0) + 2, 50)
+                for column in df.columns
+            ]
+
+            # The audit sheet is large and has a fixed schema, so it is
+            # streamed as raw OOXML rather than routed through an engine
+            ExcelOutputWriter._write_xlsx_stream(
+                df.columns,
+                df.itertuples(index=False, name=None),
+                filepath,
+                'Audit Log',
+                widths,
+                ExcelOutputWriter._column_serializers(df),
+            )
+
             logger.info(f"Audit log saved to: {filepath}")
-            
+
         except Exception as e:
             logger.error(f"Error saving audit log to {filepath}: {str(e)}")
             raise
     
+    # Summary reports are cached on disk keyed by input content, so repeated
+    # runs over unchanged data skip the statistics scans entirely
+    _CACHE_DIR = Path('.cache')
+
+    @staticmethod
+    def _summary_cache_key(results_df: pd.DataFrame, audit_df: pd.DataFrame) -> str:
+        """
+        Compute a content hash over both report inputs.
+
+        Args:
+            results_df: DataFrame with matched results
+            audit_df: DataFrame with audit records
+
+        Returns:
+            Hex digest identifying this pair of inputs
+        """
+        digest = hashlib.sha1()
+        digest.update(pd.util.hash_pandas_object(results_df, index=False).values.tobytes())
+        digest.update(pd.util.hash_pandas_object(audit_df, index=False).values.tobytes())
+        return digest.hexdigest()
+
     @staticmethod
-    def generate_summary_report(results_df: pd.DataFrame, audit_df: pd.DataFrame) -> str:
+    def generate_summary_report(results_df: pd.DataFrame, audit_df: pd.DataFrame,
+                                force: bool = False) -> str:
         """
         Generate a text summary report of the matching results.
-        
+
         Args:
             results_df: DataFrame with matched results
             audit_df: DataFrame with audit records
-            
+            force: Recompute even if a cached report exists for these inputs
+
         Returns:
             String containing the summary report
         """
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        cache_file = ExcelOutputWriter._CACHE_DIR / (
+            f"summary_{ExcelOutputWriter._summary_cache_key(results_df, audit_df)}.txt"
+        )
+        if not force and cache_file.exists():
+            report = cache_file.read_text(encoding='utf-8')
+            # The statistics are content-addressed; only the timestamp is live
+            return re.sub(r'Generated: .*', f'Generated: {timestamp}', report, count=1)
+
         total_records = len(results_df)
-        matched_records = len(results_df[results_df['Matched_Code'] != 'NO_MATCH'])
+
+        # One boolean mask reused for the count and the matched subset
+        matched_mask = results_df['Matched_Code'].to_numpy() != 'NO_MATCH'
+        matched_records = int(matched_mask.sum())
         no_match_records = total_records - matched_records
         
         # Handle division by zero for empty DataFrames
@@ -113,11 +366,10 @@ class ExcelOutputWriter:
         match_type_counts = results_df['Match_Type'].value_counts() if total_records > 0 else {}
         
         # Average score for matched records
-        matched_df = results_df[results_df['Matched_Code'] != 'NO_MATCH']
-        avg_score = matched_df['Match_Score'].mean() if len(matched_df) > 0 else 0
-        
+        avg_score = results_df.loc[matched_mask, 'Match_Score'].mean() if matched_records > 0 else 0
+
         # Numeric consistency stats
-        numeric_match_count = audit_df['Numeric_Match'].sum() if len(audit_df) > 0 else 0
+        numeric_match_count = int(audit_df['Numeric_Match'].to_numpy().sum()) if len(audit_df) > 0 else 0
         numeric_match_pct = numeric_match_count/total_records*100 if total_records > 0 else 0.0
         
         report = f"""
@@ -125,7 +377,7 @@ class ExcelOutputWriter:
          EXCEL FUZZY MATCHING PIPELINE - SUMMARY REPORT          
 ======================================================================
 
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Generated: {timestamp}
 
 MATCHING STATISTICS
 ----------------------------------------------------------------------
@@ -153,5 +405,11 @@ OUTPUT FILES
 
 ======================================================================
 """
-        
+
+        try:
+            ExcelOutputWriter._CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(report, encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not cache summary report: {str(e)}")
+
         return report
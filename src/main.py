@@ -10,7 +10,6 @@ from pathlib import Path
 # Add parent directory to path to access config and src modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.fuzzy_matcher import ExcelDataLoader, FuzzyMatcher, ExcelOutputWriter
 from src.config import constants as config
 
 
@@ -33,6 +32,10 @@ def setup_logging():
 
 def main():
     """Main pipeline execution."""
+    # Imported here so the CLI starts without paying the pandas/rapidfuzz/
+    # openpyxl import cost until the pipeline actually runs
+    from src.fuzzy_matcher import ExcelDataLoader, FuzzyMatcher, ExcelOutputWriter
+
     logger = logging.getLogger(__name__)
     
     try:
@@ -6,7 +6,6 @@ import unittest
 import sys
 import tempfile
 import os
-import warnings
 import logging
 from pathlib import Path
 import pandas as pd
@@ -14,9 +13,6 @@ import pandas as pd
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Suppress openpyxl deprecation warnings
-warnings.filterwarnings('ignore', category=DeprecationWarning, module='openpyxl')
-
 # Suppress logging during tests
 logging.getLogger('src.fuzzy_matcher').setLevel(logging.CRITICAL)
 
@@ -136,6 +136,48 @@ class TestFuzzyMatcher(unittest.TestCase):
         self.assertEqual(len(results_df), 1)
         self.assertEqual(results_df.iloc[0]['Matched_Code'], 'NO_MATCH')
     
+    def test_blocked_path_agrees_with_dense(self):
+        """Test that token blocking selects the same matches as a full scan."""
+        # Pad the reference set with disjoint-vocabulary rows so the real
+        # candidates must be found through the inverted token index
+        reference_df = pd.DataFrame({
+            'Description': list(self.reference_df['Description'])
+            + [f'filler entry row {i}' for i in range(20)],
+            'Code': list(self.reference_df['Code'])
+            + [f'FILL-{i:03d}' for i in range(20)]
+        })
+        source_df = pd.DataFrame({
+            'Description': [
+                'Office supplies purchase 150.00',
+                'Software licensing fees',
+                'Travel and accommodation'
+            ],
+            'Amount': [150.0, 0.0, 0.0]
+        })
+
+        matcher_blocked = FuzzyMatcher(threshold=70.0)
+        matcher_blocked.BLOCKING_MIN_REFERENCES = 1  # force the blocked path
+        results_blocked = matcher_blocked.match_datasets(source_df, reference_df)
+        results_dense = self.matcher.match_datasets(source_df, reference_df)
+
+        pd.testing.assert_frame_equal(results_blocked, results_dense)
+        self.assertEqual(results_blocked.iloc[0]['Matched_Code'], 'SUPP-001')
+
+    def test_blocked_path_token_disjoint_source(self):
+        """Test that a source sharing no tokens with any reference gets NO_MATCH."""
+        source_df = pd.DataFrame({
+            'Description': ['zzz qqq xxx'],
+            'Amount': [0.0]
+        })
+
+        matcher_blocked = FuzzyMatcher(threshold=70.0)
+        matcher_blocked.BLOCKING_MIN_REFERENCES = 1  # force the blocked path
+        results_df = matcher_blocked.match_datasets(source_df, self.reference_df)
+
+        self.assertEqual(len(results_df), 1)
+        self.assertEqual(results_df.iloc[0]['Matched_Code'], 'NO_MATCH')
+        self.assertEqual(results_df.iloc[0]['Match_Type'], 'No Match')
+
     def test_threshold_affects_matching(self):
         """Test that different thresholds affect match results."""
         source_df = pd.DataFrame({